@@ -241,10 +241,16 @@ CREATE TABLE arrow (
     end_id INT NOT NULL,
     arrow_no TINYINT NOT NULL COMMENT 'The sequence number of this arrow (1-6)',
     arrow_value CHAR(2) NOT NULL COMMENT 'Score value: X, 10, 9...1, M',
-    
+    arrow_points TINYINT AS (
+        CASE arrow_value WHEN 'X' THEN 10 WHEN 'M' THEN 0 ELSE CAST(arrow_value AS UNSIGNED) END
+    ) STORED COMMENT 'Numeric score derived from arrow_value (X = 10, M = 0)',
+
     -- An arrow number must be unique within its end
     UNIQUE KEY uk_end_arrow (end_id, arrow_no),
 
+    -- Lets end/session totals be summed from the index alone
+    KEY idx_arrow_end_points (end_id, arrow_points),
+
     -- Enforce business rules from the ERD
     CONSTRAINT chk_arrow_no CHECK (arrow_no BETWEEN 1 AND 6),
     CONSTRAINT chk_arrow_value CHECK (arrow_value IN 
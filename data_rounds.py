@@ -1,26 +1,33 @@
 from __future__ import annotations
 import streamlit as st
+from sqlalchemy import text
 from db_core import fetch_all
 
-@st.cache_data(ttl=60)
+# Built once at import so every call reuses the same statement object
+_SQL_LIST_ROUNDS = text(
+    """
+    SELECT r.id, r.round_name,
+    (SELECT COUNT(*) FROM round_range rr WHERE rr.round_id = r.id) AS range_count
+    FROM round r
+    ORDER BY r.round_name
+    """
+)
+
+_SQL_LIST_RANGES = text(
+    """
+    SELECT id, distance_m, face_size, ends_per_range
+    FROM round_range
+    WHERE round_id=:rid
+    ORDER BY distance_m
+    """
+)
+
+# Round definitions only change through admin action, so cache them for an
+# hour across all sessions; recorders can clear it from Manage Club.
+@st.cache_data(ttl=3600, show_spinner=False)
 def list_rounds():
-    return fetch_all(
-        """
-        SELECT r.id, r.round_name,
-        (SELECT COUNT(*) FROM round_range rr WHERE rr.round_id = r.id) AS range_count
-        FROM round r
-        ORDER BY r.round_name
-        """
-    )
+    return fetch_all(_SQL_LIST_ROUNDS)
 
-@st.cache_data(ttl=60)
+@st.cache_data(ttl=3600, show_spinner=False)
 def list_ranges(round_id: int):
-    return fetch_all(
-        """
-        SELECT id, distance_m, face_size, ends_per_range
-        FROM round_range
-        WHERE round_id=:rid
-        ORDER BY distance_m
-        """,
-        {"rid": round_id},
-    )
+    return fetch_all(_SQL_LIST_RANGES, {"rid": round_id})
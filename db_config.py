@@ -20,8 +20,11 @@ def get_engine():
     )
     
     # Create and return the engine
-    # echo=True is useful for debugging, it logs all SQL queries
-    engine = create_engine(connection_url, echo=True)
+    # echo=True is useful for debugging, but it logs every SQL query on
+    # every rerun, so keep it off by default.
+    # pool_recycle replaces pooled connections before MySQL's idle timeout
+    # drops them, so the cached engine keeps reusing live connections.
+    engine = create_engine(connection_url, echo=False, pool_recycle=3600)
     return engine
 
 if __name__ == "__main__":
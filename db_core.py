@@ -1,7 +1,7 @@
 from __future__ import annotations
 import contextlib
 import streamlit as st
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from db_config import get_engine as _get_engine
 
 @st.cache_resource
@@ -21,14 +21,21 @@ def rw_tx():
     with get_engine().begin() as tx:
         yield tx
 
-def fetch_one(sql: str, params: dict | None = None):
+def _stmt(sql: str | TextClause) -> TextClause:
+    """Accept raw SQL or a prebuilt text() clause (reused across calls)."""
+    return sql if isinstance(sql, TextClause) else text(sql)
+
+def fetch_one(sql: str | TextClause, params: dict | None = None) -> dict | None:
     with ro_conn() as c:
-        return c.execute(text(sql), params or {}).mappings().fetchone()
+        row = c.execute(_stmt(sql), params or {}).mappings().fetchone()
+    return dict(row) if row else None
 
-def fetch_all(sql: str, params: dict | None = None):
+def fetch_all(sql: str | TextClause, params: dict | None = None) -> list[dict]:
+    """Rows as plain dicts: callers can annotate them in place, and
+    st.cache_data pickles them without SQLAlchemy row objects."""
     with ro_conn() as c:
-        return c.execute(text(sql), params or {}).mappings().fetchall()
+        return [dict(r) for r in c.execute(_stmt(sql), params or {}).mappings()]
 
-def exec_sql(sql: str, params: dict | None = None):
+def exec_sql(sql: str | TextClause, params: dict | None = None):
     with rw_tx() as tx:
-        tx.execute(text(sql), params or {})
+        tx.execute(_stmt(sql), params or {})
@@ -1,6 +1,7 @@
 """Recorder Management Page"""
 import streamlit as st
 from guards import require_recorder
+from data_rounds import list_rounds, list_ranges
 
 @require_recorder
 def show_recorder_management():
@@ -17,6 +18,11 @@ def show_recorder_management():
     st.markdown("### 🎯 Round Management")
     st.info("Add or update official round definitions.")
     st.write("⚙️ Coming soon: Import or modify round data")
+    if st.button("🔄 Reload round data"):
+        # Round lookups are cached for an hour; drop them after DB edits
+        list_rounds.clear()
+        list_ranges.clear()
+        st.success("Round data will be reloaded from the database.")
 
     st.markdown("### 🏆 Competition Setup")
     st.info("Define club competitions and link them to rounds.")
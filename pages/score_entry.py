@@ -1,7 +1,30 @@
 """Score Entry Page"""
 import streamlit as st
+import pandas as pd
 from guards import require_archer
 
+# Arrow score options and labels, shared by every rerun
+_SCORE_OPTIONS = ("M", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "X")
+_ARROW_LABELS = tuple(f"Arrow {i}" for i in range(1, 7))
+
+# Points for each arrow score option (X counts as 10, M as 0)
+_SCORE_MAP = {"M": 0, "X": 10, **{str(i): i for i in range(1, 11)}}
+
+def _end_total(arrow_values) -> int:
+    """Points for one end of six arrows.
+
+    A segmented control can be clicked off (None); that arrow counts as a miss.
+    """
+    # Unrolled: an end is always exactly six arrows
+    return (
+        _SCORE_MAP[arrow_values[0] or "M"]
+        + _SCORE_MAP[arrow_values[1] or "M"]
+        + _SCORE_MAP[arrow_values[2] or "M"]
+        + _SCORE_MAP[arrow_values[3] or "M"]
+        + _SCORE_MAP[arrow_values[4] or "M"]
+        + _SCORE_MAP[arrow_values[5] or "M"]
+    )
+
 @require_archer
 def show_score_entry():
 # ==========================================================
@@ -11,6 +34,15 @@ def show_score_entry():
     st.subheader("Sarah Johnson")
     st.caption("Live Score Entry")
 
+    # Seed page state once per browser session instead of re-checking each
+    # key on every rerun
+    if "score_entry_initialized" not in st.session_state:
+        st.session_state.update({
+            "current_end": 1,
+            "scores": [],
+            "score_entry_initialized": True,
+        })
+
     # Round Selection
     st.markdown("### Select Round")
     selected_round = st.selectbox(
@@ -20,71 +52,84 @@ def show_score_entry():
 
     if selected_round:
         st.info("Now Shooting: 6 ends at 90m, 122cm face")
-        st.markdown(f"### End {st.session_state.current_end} of 6")
-
-        # Dropdowns for arrow scores
-        arrow_labels = [f"Arrow {i}" for i in range(1, 7)]
-        score_options = ["M", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "X"]
-
-        arrow_values = []
-        cols = st.columns(3)
-        for i, label in enumerate(arrow_labels[:3]):
-            arrow_values.append(
-                cols[i].selectbox(
-                    label,
-                    score_options,
-                    index=score_options.index("M"),
-                    key=f"arrow_{st.session_state.current_end}_{i+1}"
-                )
-            )
+        _render_arrow_entry()
+
+def _arrow_key(end_no: int, i: int) -> str:
+    """Session-state key of an end's arrow widget (i is 1-6)."""
+    return f"arrow_{end_no}_{i}"
+
+def _clear_end_widgets(end_no: int) -> None:
+    """Drop an end's arrow widget state once it is no longer needed."""
+    for i in range(1, 7):
+        st.session_state.pop(_arrow_key(end_no, i), None)
 
-        cols2 = st.columns(3)
-        for i, label in enumerate(arrow_labels[3:]):
-            arrow_values.append(
-                cols2[i].selectbox(
-                    label,
-                    score_options,
-                    index=score_options.index("M"),
-                    key=f"arrow_{st.session_state.current_end}_{i+4}"
-                )
+def _record_end():
+    """Form callback: score the submitted end and advance to the next one."""
+    # The round is complete after six ends; ignore any further submits
+    if len(st.session_state.scores) >= 6:
+        return
+    end_no = st.session_state.current_end
+    arrow_values = [st.session_state[_arrow_key(end_no, i)] for i in range(1, 7)]
+    end_total = _end_total(arrow_values)
+    st.session_state.scores.append(end_total)
+    _clear_end_widgets(end_no)
+    st.session_state.current_end = min(end_no + 1, 6)
+
+def _reset_round():
+    _clear_end_widgets(st.session_state.current_end)
+    st.session_state.current_end = 1
+    st.session_state.scores = []
+
+@st.fragment
+def _render_arrow_entry():
+    """End entry, totals and summary.
+
+    Runs as a fragment: submitting an end or resetting reruns only this
+    block, not the page header, auth guard and round selection above it.
+    """
+    st.markdown(f"### End {st.session_state.current_end} of 6")
+
+    # Arrow scores as inline segmented controls (one click per arrow, lighter
+    # than six dropdowns). They live in a form so picking arrows doesn't
+    # rerun anything; only "Next End" submits the whole end.
+    with st.form(f"end_form_{st.session_state.current_end}"):
+        for i, label in enumerate(_ARROW_LABELS, start=1):
+            st.segmented_control(
+                label,
+                _SCORE_OPTIONS,
+                default="M",
+                key=_arrow_key(st.session_state.current_end, i)
             )
 
-        # Convert scores
-        def convert(score):
-            if score == "X":
-                return 10
-            if score == "M":
-                return 0
-            return int(score)
-
-        numeric_scores = [convert(a) for a in arrow_values]
-        end_total = sum(numeric_scores)
-
-        # Display Totals
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-        col1.metric("End Total", end_total)
-        col2.metric("Running Total", st.session_state.running_total)
-
-        # Buttons
-        col_next, col_reset = st.columns([1, 1])
-        with col_next:
-            if st.button("Next End ➡️"):
-                st.session_state.scores.append(end_total)
-                st.session_state.running_total += end_total
-                st.session_state.current_end += 1
-                if st.session_state.current_end > 6:
-                    st.session_state.current_end = 6
-                    st.success("🎯 Round Completed! All 6 ends recorded.")
-        with col_reset:
-            if st.button("🔁 Reset Round"):
-                st.session_state.current_end = 1
-                st.session_state.running_total = 0
-                st.session_state.scores = []
-                st.rerun()
-
-        # Display previous end totals
-        if st.session_state.scores:
-            st.markdown("### 🧾 Summary of Ends")
-            for i, score in enumerate(st.session_state.scores, start=1):
-                st.write(f"End {i}: {score} points")
\ No newline at end of file
+        # Recorded in a callback so the state is updated before the
+        # (fragment) rerun renders the next end's form
+        st.form_submit_button(
+            "Next End ➡️",
+            on_click=_record_end,
+            disabled=len(st.session_state.scores) >= 6,
+        )
+
+    scores = st.session_state.scores
+    if len(scores) >= 6:
+        st.success("🎯 Round Completed! All 6 ends recorded.")
+
+    # Display Totals (the running total is derived, so it can't drift from
+    # the recorded ends)
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    col1.metric("Last End Total", scores[-1] if scores else 0)
+    col2.metric("Running Total", sum(scores))
+
+    # Buttons
+    st.button("🔁 Reset Round", on_click=_reset_round)
+
+    # Display previous end totals as one table (not a st.write per end).
+    # The table is only built when the archer asks for it; an expander would
+    # still run its body on every rerun.
+    if scores:
+        st.markdown("### 🧾 Summary of Ends")
+        if st.toggle("Show end-by-end scores", key="show_end_summary"):
+            summary = pd.DataFrame(
+                {"End": range(1, len(scores) + 1), "Points": scores}
+            ).astype({"End": "int8", "Points": "int16"})
+            st.dataframe(summary, hide_index=True, width="stretch")
\ No newline at end of file
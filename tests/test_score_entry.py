@@ -0,0 +1,22 @@
+from pages.score_entry import _arrow_key, _end_total
+
+
+def test_end_total_all_x():
+    assert _end_total(["X"] * 6) == 60
+
+
+def test_end_total_all_misses():
+    assert _end_total(["M"] * 6) == 0
+
+
+def test_end_total_mixed():
+    assert _end_total(["X", "10", "9", "5", "1", "M"]) == 35
+
+
+def test_end_total_cleared_arrow_scores_as_miss():
+    assert _end_total(["X", None, "9", "9", "9", "9"]) == 46
+
+
+def test_arrow_key_is_unique_per_end_and_arrow():
+    keys = {_arrow_key(end_no, i) for end_no in range(1, 7) for i in range(1, 7)}
+    assert len(keys) == 36